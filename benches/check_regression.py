@@ -45,6 +45,18 @@ We intentionally use this CONSERVATIVE bound because:
 2. Performance distributions are often long-tailed
 3. Early detection is better than missed regressions
 
+Opt-in alternative (--tail-method pot): Peaks-Over-Threshold. A Generalized
+Pareto Distribution is fitted (probability-weighted moments) to the raw
+criterion samples in sample.json above their 90th percentile and
+extrapolated to P99. Needs >= 100 samples; otherwise mean + 5*std_dev is
+used. Baselines are calibrated for mean + 5*std_dev, so POT tails compare
+low against them.
+
+Opt-in --bootstrap: percentile bootstrap CIs of the median and tail are
+computed from sample.json, and a P50/tail regression is reported only
+when the lower CI bound of the ratio to baseline exceeds its threshold.
+The hard limit and the Tail/P50 ratio stay point comparisons.
+
 W18.3 v1.3 Hostile Review Fixes:
 - [M4] Baselines tightened to measured values + 20% buffer
 - [M5] Tail baselines calibrated from actual benchmark runs
@@ -55,10 +67,22 @@ W18.3 v1.3 Hostile Review Fixes:
 from __future__ import annotations
 
 import argparse
+import functools
+import io
 import json
+import math
+import os
+import random
+import statistics
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator, NamedTuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json is the fallback
+    orjson = None
 
 # =============================================================================
 # CONSTANTS
@@ -77,66 +101,266 @@ TAIL_MEDIAN_RATIO_MAX: float = 5.0  # Tail can be up to 5x median
 # Using 5 for conservative tail estimate (~P99.99997 for normal distributions)
 TAIL_STDDEV_MULTIPLIER: float = 5.0
 
-# Supported units for conversion
-SUPPORTED_UNITS: set[str] = {"ns", "us", "ms", "s"}
+# Opt-in POT/GPD tail estimation (--tail-method pot): fit a Generalized
+# Pareto Distribution to raw criterion samples above the POT_THRESHOLD_QUANTILE
+# and extrapolate to POT_PERCENTILE. Below POT_MIN_SAMPLES samples the
+# mean + N*std_dev estimate is used instead.
+TAIL_METHODS: tuple[str, ...] = ("stddev", "pot")
+POT_PERCENTILE: float = 0.99
+POT_THRESHOLD_QUANTILE: float = 0.90
+POT_MIN_SAMPLES: int = 100
+POT_CONFIDENCE: float = 0.95  # For the sample-count warning
+
+# Opt-in bootstrap confidence intervals (--bootstrap): P50 and tail
+# regressions are reported only when the lower CI bound of the ratio to
+# baseline exceeds the threshold. The fixed seed keeps reruns on the same
+# sample.json reproducible.
+BOOTSTRAP_RESAMPLES: int = 2_000
+BOOTSTRAP_ALPHA: float = 0.05
+BOOTSTRAP_SEED: int = 0
+
+# Supported units for conversion (nanoseconds per unit)
+NS_PER_UNIT: dict[str, float] = {
+    "ns": 1.0,
+    "us": 1_000.0,
+    "ms": 1_000_000.0,
+    "s": 1_000_000_000.0,
+}
+
+# Baseline entry schema, checked once by validate_baselines: required
+# fields and the numeric fields' accepted types ("unit" must be in NS_PER_UNIT)
+BASELINE_REQUIRED_FIELDS: tuple[str, ...] = ("p50",)
+BASELINE_NUMERIC_FIELDS: tuple[str, ...] = ("p50", "tail", "p99", "hard_limit")
 
 # Benchmark group name (hardcoded for now)
 BENCHMARK_GROUP: str = "validation"
 
+# Incremental validation cache, written next to the criterion results.
+# Entries are reused while their estimates.json path and mtime are unchanged.
+REGRESSION_CACHE_FILE: str = ".regression_cache.json"
+REGRESSION_CACHE_VERSION: int = 3
+
 
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
 
+def _load_json(path: str | os.PathLike[str]) -> Any:
+    """
+    Parse a JSON file, using orjson when it is installed.
+
+    Reads raw bytes in one call so neither parser goes through a
+    text-mode decoder.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=4096)
+def _load_json_cached(resolved_path: str, mtime_ns: int) -> Any:
+    """
+    Memoized _load_json, keyed by canonical path and modification time.
+
+    Callers pass a resolved path so different spellings of the same file
+    share one cache entry, plus its st_mtime_ns so a rewritten file is
+    parsed again. The returned object is shared; treat it as read-only.
+    """
+    return _load_json(resolved_path)
+
+
+def validate_baselines(baseline: Any) -> list[str]:
+    """
+    Check a parsed baselines.json against the baseline schema in one pass.
+
+    Every benchmark entry must be an object with the
+    BASELINE_REQUIRED_FIELDS; any BASELINE_NUMERIC_FIELDS present must be
+    non-bool numbers (null is rejected) and the unit a supported string.
+    Other keys are descriptive and ignored.
+
+    Returns:
+        One message per violation; empty when the baseline is valid
+    """
+    if not isinstance(baseline, dict):
+        return ["baseline must be a JSON object"]
+    benchmarks = baseline.get("benchmarks", {})
+    if not isinstance(benchmarks, dict):
+        return ["'benchmarks' must be a JSON object"]
+
+    errors: list[str] = []
+    for name, config in benchmarks.items():
+        if not isinstance(config, dict):
+            errors.append(f"{name}: entry must be a JSON object")
+            continue
+        for field in BASELINE_REQUIRED_FIELDS:
+            if field not in config:
+                errors.append(f"{name}: missing required field '{field}'")
+        for field in BASELINE_NUMERIC_FIELDS:
+            if field not in config:
+                continue
+            value = config[field]
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                errors.append(f"{name}: '{field}' must be a number, got {value!r}")
+        unit = config.get("unit", "ns")
+        if not isinstance(unit, str) or unit not in NS_PER_UNIT:
+            errors.append(f"Unsupported unit in baseline for {name}: {unit} (supported: {', '.join(NS_PER_UNIT)})")
+    return errors
+
+
 def load_baselines(path: Path) -> dict[str, Any]:
-    """Load baseline values from JSON file."""
+    """
+    Load baseline values from JSON file.
+
+    The baseline is validated here, once, so check_regression can index
+    its fields without per-benchmark error handling.
+    """
     if not path.exists():
         print(f"ERROR: Baseline file not found: {path}")
         sys.exit(2)
 
-    with open(path) as f:
-        return json.load(f)
+    resolved = str(path.resolve())
+    baseline = _load_json_cached(resolved, os.stat(resolved).st_mtime_ns)
+
+    errors = validate_baselines(baseline)
+    if errors:
+        for error in errors:
+            print(f"ERROR: {error}")
+        sys.exit(2)
+
+    return baseline
 
 
-def find_criterion_estimate(benchmark_dir: Path) -> dict[str, Any] | None:
+def _discover_estimates(
+    results_dir: Path,
+    names: Iterable[str] | None = None,
+) -> dict[str, str | None]:
+    """
+    Map benchmark directories under <results>/<group>/ to their estimates.json.
+
+    A single os.scandir pass lists the group directory; when names is
+    given, only those benchmarks are probed, so baseline entries with no
+    results and criterion's own report/ directory cost no further
+    syscalls. Names with a "/" are criterion IDs nested below a top-level
+    directory (BenchmarkId parameters); they are probed directly once
+    their first component is listed. Paths are built as plain strings
+    from a canonical group prefix. Benchmarks whose directory exists but
+    holds neither new/ nor base/ estimates map to None.
+    """
+    group_dir = os.path.realpath(results_dir / BENCHMARK_GROUP)
+    discovered: dict[str, str | None] = {}
+
+    try:
+        with os.scandir(group_dir) as it:
+            present = {entry.name for entry in it if entry.is_dir()}
+    except OSError:
+        return discovered
+
+    if names is not None:
+        names = set(names)
+        nested = {
+            name for name in names
+            if "/" in name
+            and name.split("/", 1)[0] in present
+            and os.path.isdir(f"{group_dir}/{name}")
+        }
+        present.intersection_update(names)
+        present.update(nested)
+
+    for name in present:
+        discovered[name] = None
+        # Prefer new/, fall back to base/ for comparison runs
+        for run in ("new", "base"):
+            estimates_path = f"{group_dir}/{name}/{run}/estimates.json"
+            if os.path.isfile(estimates_path):
+                discovered[name] = estimates_path
+                break
+
+    return discovered
+
+
+def _submit_estimates(
+    executor: ThreadPoolExecutor,
+    estimates_paths: dict[str, str],
+    mtimes: dict[str, int],
+) -> dict[str, Future[Any]]:
     """
-    Find estimates from criterion's estimates.json.
+    Start parsing several estimates.json files concurrently.
 
-    Criterion stores results in:
-    target/criterion/<group>/<benchmark>/new/estimates.json
+    The files are small and spread over many directories, so open/read
+    latency dominates; a thread pool overlaps it. Paths from
+    _discover_estimates are already canonical and, with their mtimes,
+    serve as cache keys.
 
-    Returns full estimates dict for tail extraction.
+    Returns one future per benchmark name; callers may cancel the ones
+    they no longer need.
     """
-    estimates_path = benchmark_dir / "new" / "estimates.json"
-    if not estimates_path.exists():
-        # Try base.json for comparison runs
-        estimates_path = benchmark_dir / "base" / "estimates.json"
+    return {
+        name: executor.submit(_load_json_cached, path, mtimes[name])
+        for name, path in estimates_paths.items()
+    }
 
-    if not estimates_path.exists():
-        return None
 
-    with open(estimates_path) as f:
-        return json.load(f)
+def _load_metrics_cache(results_dir: Path, settings: dict[str, Any]) -> dict[str, list[Any]]:
+    """
+    Load cached per-benchmark metrics from a previous run.
+
+    Returns {name: [estimates_path, mtime_ns, median_ns, tail_ns, tail_estimated]},
+    or an empty dict if the cache is missing, unreadable, or was written
+    with a different format or different estimation settings.
+    """
+    try:
+        cache = _load_json(results_dir / REGRESSION_CACHE_FILE)
+    except (OSError, ValueError):
+        return {}
+
+    if (
+        not isinstance(cache, dict)
+        or cache.get("version") != REGRESSION_CACHE_VERSION
+        or cache.get("settings") != settings
+    ):
+        return {}
+    return cache.get("benchmarks", {})
+
+
+def _save_metrics_cache(
+    results_dir: Path,
+    entries: dict[str, list[Any]],
+    settings: dict[str, Any],
+) -> None:
+    """Persist per-benchmark metrics for the next run (best effort)."""
+    cache = {
+        "version": REGRESSION_CACHE_VERSION,
+        "settings": settings,
+        "benchmarks": entries,
+    }
+    try:
+        (results_dir / REGRESSION_CACHE_FILE).write_text(json.dumps(cache, indent=2))
+    except OSError:
+        pass
 
 
 def extract_median_ns(estimates: dict[str, Any]) -> float | None:
     """Extract median in nanoseconds from Criterion estimates."""
     # Try median first (most accurate)
-    if "median" in estimates:
-        median = estimates["median"]
-        if isinstance(median, dict) and "point_estimate" in median:
-            return float(median["point_estimate"])
-
-    # Fall back to slope (for iterated benchmarks)
-    if "slope" in estimates and estimates["slope"] is not None:
-        slope = estimates["slope"]
-        if isinstance(slope, dict) and "point_estimate" in slope:
-            return float(slope["point_estimate"])
-
-    return None
+    try:
+        return float(estimates["median"]["point_estimate"])
+    except (KeyError, TypeError):
+        pass
+
+    # Fall back to slope (for iterated benchmarks; null when absent)
+    try:
+        return float(estimates["slope"]["point_estimate"])
+    except (KeyError, TypeError):
+        return None
 
 
-def extract_tail_ns(estimates: dict[str, Any], benchmark_name: str) -> tuple[float | None, bool]:
+def extract_tail_ns(
+    estimates: dict[str, Any],
+    benchmark_name: str,
+    log: Callable[[str], Any] | None = print,
+) -> tuple[float | None, bool]:
     """
     Extract tail latency estimate in nanoseconds from Criterion estimates.
 
@@ -145,232 +369,575 @@ def extract_tail_ns(estimates: dict[str, Any], benchmark_name: str) -> tuple[flo
 
     Uses mean + 5*std_dev for conservative tail estimate.
     This is intentionally more conservative than true P99.
+    Reports how the tail was derived through log (None for silence).
     """
-    if "mean" in estimates and "std_dev" in estimates:
-        mean = estimates["mean"]
-        std_dev = estimates["std_dev"]
+    mean = estimates.get("mean")
 
-        if isinstance(mean, dict) and isinstance(std_dev, dict):
-            mean_ns = mean.get("point_estimate", 0)
-            std_dev_ns = std_dev.get("point_estimate", 0)
-
-            if mean_ns > 0 and std_dev_ns >= 0:
-                tail_estimate = mean_ns + (TAIL_STDDEV_MULTIPLIER * std_dev_ns)
-                print(f"  [{benchmark_name}] Tail estimated: mean({mean_ns:.0f}) + {TAIL_STDDEV_MULTIPLIER}*std_dev({std_dev_ns:.0f}) = {tail_estimate:.0f} ns")
-                return tail_estimate, True
+    try:
+        mean_ns = mean["point_estimate"]
+        std_dev_ns = estimates["std_dev"]["point_estimate"]
+    except (KeyError, TypeError):
+        pass
+    else:
+        if mean_ns > 0 and std_dev_ns >= 0:
+            tail_estimate = mean_ns + (TAIL_STDDEV_MULTIPLIER * std_dev_ns)
+            if log is not None:
+                log(f"  [{benchmark_name}] Tail estimated: mean({mean_ns:.0f}) + {TAIL_STDDEV_MULTIPLIER}*std_dev({std_dev_ns:.0f}) = {tail_estimate:.0f} ns")
+            return tail_estimate, True
 
     # Final fallback: use upper confidence bound
-    if "mean" in estimates:
-        mean = estimates["mean"]
-        if isinstance(mean, dict):
-            ci = mean.get("confidence_interval", {})
-            upper = ci.get("upper_bound")
-            if upper:
-                print(f"  [{benchmark_name}] Tail fallback: using mean upper CI bound = {upper:.0f} ns")
-                return float(upper), True
+    try:
+        upper = mean["confidence_interval"]["upper_bound"]
+    except (KeyError, TypeError):
+        upper = None
+    if upper:
+        if log is not None:
+            log(f"  [{benchmark_name}] Tail fallback: using mean upper CI bound = {upper:.0f} ns")
+        return float(upper), True
 
     return None, False
 
 
-def convert_ns_to_unit(value_ns: float, unit: str) -> float:
+def load_criterion_samples(run_dir: str) -> list[float] | None:
+    """
+    Load per-iteration times in nanoseconds from criterion's sample.json.
+
+    run_dir is the new/ or base/ directory holding estimates.json; criterion
+    writes sample.json ({"iters": [...], "times": [...]}) next to it.
+    """
+    try:
+        sample = _load_json(os.path.join(run_dir, "sample.json"))
+        return [time_ns / iters for iters, time_ns in zip(sample["iters"], sample["times"])]
+    except (OSError, ValueError, KeyError, TypeError, ZeroDivisionError):
+        return None
+
+
+def required_samples(percentile: float, confidence: float = POT_CONFIDENCE) -> int:
+    """
+    Smallest sample count that observes the percentile with the given confidence.
+
+    Solves 1 - percentile**n >= confidence for n, i.e. the probability of at
+    least one sample beyond the percentile.
+    """
+    return math.ceil(math.log(1.0 - confidence) / math.log(percentile))
+
+
+def _fit_gpd_pwm(excesses: list[float]) -> tuple[float, float] | None:
+    """
+    Fit a Generalized Pareto Distribution by probability-weighted moments.
+
+    Uses the Hosking & Wallis (1987) estimators, which stay stable for the
+    small exceedance counts POT gets from criterion sample sizes.
+
+    Returns:
+        (shape xi, scale sigma), or None for a degenerate fit
     """
-    Convert nanoseconds to the target unit.
+    x = sorted(excesses)
+    n = len(x)
+    if n < 2:
+        return None
 
-    Validates unit is supported, raises error otherwise.
+    a0 = sum(x) / n
+    a1 = sum((n - 1 - j) * value for j, value in enumerate(x)) / (n * (n - 1))
+    denom = a0 - 2.0 * a1
+    if denom <= 0:
+        return None
+
+    xi = 2.0 - a0 / denom
+    sigma = 2.0 * a0 * a1 / denom
+    if sigma <= 0:
+        return None
+    return xi, sigma
+
+
+def extract_tail_pot(
+    run_dir: str,
+    benchmark_name: str,
+    percentile: float = POT_PERCENTILE,
+    log: Callable[[str], Any] | None = print,
+    samples: list[float] | None = None,
+) -> float | None:
     """
-    if unit not in SUPPORTED_UNITS:
-        raise ValueError(f"Unsupported unit '{unit}'. Supported: {SUPPORTED_UNITS}")
+    Estimate a tail percentile in nanoseconds with Peaks-Over-Threshold.
+
+    Takes the POT_THRESHOLD_QUANTILE of the raw samples as threshold u,
+    fits a GPD to the excesses over u and returns the fitted quantile:
+        u + sigma/xi * (((1 - p) / zeta_u) ** -xi - 1)
+    where zeta_u is the fraction of samples above u.
 
-    if unit == "ns":
-        return value_ns
-    elif unit == "us":
-        return value_ns / 1_000.0
-    elif unit == "ms":
-        return value_ns / 1_000_000.0
-    elif unit == "s":
-        return value_ns / 1_000_000_000.0
+    Pass samples to reuse already loaded per-iteration times instead of
+    reading run_dir/sample.json again. The fit and any sample-count
+    warning are reported through log (None for silence).
+
+    Returns None (callers fall back to extract_tail_ns) when sample.json
+    is missing, holds fewer than POT_MIN_SAMPLES samples, or the fit is
+    degenerate.
+    """
+    if samples is None:
+        samples = load_criterion_samples(run_dir)
+        if samples is None:
+            return None
+
+    n = len(samples)
+    needed = required_samples(percentile)
+    if log is not None and n < needed:
+        log(
+            f"  [{benchmark_name}] WARNING: {n} samples; P{percentile * 100:g} needs >= {needed} "
+            f"for {POT_CONFIDENCE:.0%} confidence"
+        )
+    if n < POT_MIN_SAMPLES:
+        return None
+
+    ordered = sorted(samples)
+    threshold = ordered[int(POT_THRESHOLD_QUANTILE * (n - 1))]
+    excesses = [value - threshold for value in ordered if value > threshold]
+    tail_fraction = (1.0 - percentile) * n / len(excesses) if excesses else 1.0
+    if tail_fraction >= 1.0:
+        return None
+
+    fit = _fit_gpd_pwm(excesses)
+    if fit is None:
+        return None
+    xi, sigma = fit
+
+    if abs(xi) < 1e-9:
+        tail_estimate = threshold - sigma * math.log(tail_fraction)
     else:
-        return value_ns
+        tail_estimate = threshold + sigma / xi * (tail_fraction ** -xi - 1.0)
+
+    if log is not None:
+        log(
+            f"  [{benchmark_name}] Tail POT/GPD: u({threshold:.0f}) xi={xi:.3f} sigma={sigma:.0f} "
+            f"over {len(excesses)}/{n} samples -> P{percentile * 100:g} = {tail_estimate:.0f} ns"
+        )
+    return tail_estimate
+
+
+def _mean_plus_k_stddev(samples: list[float]) -> float:
+    """mean + TAIL_STDDEV_MULTIPLIER * std_dev of samples, matching extract_tail_ns."""
+    n = len(samples)
+    mean = math.fsum(samples) / n
+    variance = math.fsum((value - mean) ** 2 for value in samples) / (n - 1)
+    return mean + TAIL_STDDEV_MULTIPLIER * math.sqrt(variance)
+
+
+def bootstrap_ci(
+    samples: list[float],
+    stat: Callable[[list[float]], float] = statistics.median,
+    n_resamples: int = BOOTSTRAP_RESAMPLES,
+    alpha: float = BOOTSTRAP_ALPHA,
+) -> tuple[float, float]:
+    """
+    Percentile bootstrap confidence interval of stat over samples.
+
+    Resamples with replacement n_resamples times from a generator seeded
+    with BOOTSTRAP_SEED, so identical samples give identical bounds.
+    Needs at least 2 samples.
+
+    Returns:
+        (lower, upper) bounds of the (1 - alpha) interval
+    """
+    rng = random.Random(BOOTSTRAP_SEED)
+    k = len(samples)
+    estimates = sorted(stat(rng.choices(samples, k=k)) for _ in range(n_resamples))
+    lower = estimates[int(alpha / 2 * (n_resamples - 1))]
+    upper = estimates[math.ceil((1 - alpha / 2) * (n_resamples - 1))]
+    return lower, upper
+
+
+def _ci_text(ci: tuple[float, float] | list[float] | None) -> str:
+    """Format a ratio confidence interval for check reasons ("" without one)."""
+    if ci is None:
+        return ""
+    return f" ({1 - BOOTSTRAP_ALPHA:.0%} CI {ci[0]:.1%}-{ci[1]:.1%})"
+
+
+def _tail_method_description(tail_method: str) -> str:
+    """Human-readable description of how tail latency was estimated."""
+    stddev = f"mean + {TAIL_STDDEV_MULTIPLIER}*std_dev"
+    if tail_method == "pot":
+        return (
+            f"POT/GPD P{POT_PERCENTILE * 100:g} from raw samples "
+            f"({stddev} below {POT_MIN_SAMPLES} samples)"
+        )
+    return f"{stddev} (conservative bound)"
+
+
+def _flush_tail_log(tail_log: list[str]) -> None:
+    """Write buffered tail estimation messages to stdout in one call."""
+    if tail_log:
+        sys.stdout.write("\n".join(tail_log) + "\n")
 
 
 def get_baseline_tail(config: dict[str, Any]) -> float:
-    """Get tail baseline, supporting both 'tail' and legacy 'p99' keys."""
-    return config.get("tail", config.get("p99", 0))
+    """
+    Get tail baseline, supporting both 'tail' and legacy 'p99' keys.
+
+    A zero or missing 'tail' falls through to 'p99'; zero already means
+    "no tail baseline" to the checks.
+    """
+    return config.get("tail") or config.get("p99", 0)
+
+
+class BenchmarkBaseline(NamedTuple):
+    """Baseline values for one benchmark, compiled once from baselines.json."""
+
+    name: str
+    p50: float
+    tail: float
+    hard_limit: float
+    unit: str
+    ns_per_unit: float
+
+
+def _compile_baselines(baseline: dict[str, Any]) -> list[BenchmarkBaseline]:
+    """
+    Resolve every benchmark's defaults and unit divisor up front.
+
+    Expects a baseline accepted by validate_baselines (load_baselines
+    enforces this), so required fields and units are indexed directly.
+    """
+    compiled: list[BenchmarkBaseline] = []
+    for name, config in baseline.get("benchmarks", {}).items():
+        unit = config.get("unit", "ns")
+        compiled.append(BenchmarkBaseline(
+            name=name,
+            p50=config["p50"],
+            tail=get_baseline_tail(config),
+            hard_limit=config.get("hard_limit", float("inf")),
+            unit=unit,
+            ns_per_unit=NS_PER_UNIT[unit],
+        ))
+    return compiled
+
+
+def _passing_checks(result: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Rebuild the check records for a fast-path PASS result.
+
+    _check_one does not store per-check records when every check
+    passes; this recreates them from the stored ratios for display.
+    """
+    checks: list[dict[str, Any]] = []
+    if "p50_ratio" in result:
+        checks.append({
+            "name": "P50 Regression",
+            "passed": True,
+            "reason": f"P50 {result['p50_ratio']:.1%} of baseline{_ci_text(result.get('p50_ratio_ci'))}"
+        })
+    if "tail_ratio" in result:
+        checks.append({
+            "name": "Tail Regression",
+            "passed": True,
+            "reason": f"Tail {result['tail_ratio']:.1%} of baseline{_ci_text(result.get('tail_ratio_ci'))}"
+        })
+    if "tail_p50_ratio" in result:
+        checks.append({
+            "name": "Tail/P50 Ratio",
+            "passed": True,
+            "reason": f"Tail/P50 ratio {result['tail_p50_ratio']:.2f}x (OK)"
+        })
+    return checks
 
 
 # =============================================================================
 # MAIN REGRESSION CHECK
 # =============================================================================
 
+def _check_one(
+    bl: BenchmarkBaseline,
+    current_median_ns: float | None,
+    current_tail_ns: float | None,
+    tail_estimated: bool,
+    threshold: float,
+    strict_tail: bool,
+    ci_ns: dict[str, list[float]] | None = None,
+) -> dict[str, Any]:
+    """
+    Run the regression checks for one benchmark's extracted metrics.
+
+    ci_ns optionally holds bootstrap (lower, upper) bounds in nanoseconds
+    under "p50" and/or "tail"; a metric with bounds regresses only when
+    its lower bound exceeds the threshold.
+
+    Pure function of its arguments; returns the benchmark's result dict.
+    """
+    if current_median_ns is None:
+        return {
+            "status": "SKIP",
+            "reason": "Could not extract median from estimates",
+        }
+
+    # FAIL if tail extraction fails and baseline expects tail
+    baseline_tail = bl.tail
+    if current_tail_ns is None and baseline_tail > 0 and strict_tail:
+        return {
+            "status": "FAIL",
+            "reason": "Could not extract tail from estimates (baseline requires tail)",
+        }
+
+    # Get baseline values and unit
+    unit = bl.unit
+    baseline_p50 = bl.p50
+    hard_limit = bl.hard_limit
+
+    # Convert to target unit
+    current_median = current_median_ns / bl.ns_per_unit
+    current_tail = current_tail_ns / bl.ns_per_unit if current_tail_ns else None
+
+    # Initialize result
+    result: dict[str, Any] = {
+        "current_p50": current_median,
+        "current_tail": current_tail,
+        "baseline_p50": baseline_p50,
+        "baseline_tail": baseline_tail,
+        "unit": unit,
+        "tail_estimated": tail_estimated,
+    }
+
+    # Compute every ratio and threshold flag up front; messages are
+    # formatted from these below
+    p50_ratio = current_median / baseline_p50 if baseline_p50 > 0 else None
+    tail_ratio = (
+        current_tail / baseline_tail
+        if current_tail is not None and baseline_tail > 0 else None
+    )
+    tail_p50_ratio = (
+        current_tail / current_median
+        if current_tail is not None and current_median > 0 else None
+    )
+
+    p50_ci = tail_ci = None
+    if ci_ns is not None:
+        if p50_ratio is not None and "p50" in ci_ns:
+            lower, upper = ci_ns["p50"]
+            p50_ci = (lower / bl.ns_per_unit / baseline_p50, upper / bl.ns_per_unit / baseline_p50)
+        if tail_ratio is not None and "tail" in ci_ns:
+            lower, upper = ci_ns["tail"]
+            tail_ci = (lower / bl.ns_per_unit / baseline_tail, upper / bl.ns_per_unit / baseline_tail)
+
+    over_hard_limit = p50_ratio is not None and current_median > hard_limit
+    p50_regressed = p50_ratio is not None and (p50_ci[0] if p50_ci else p50_ratio) > threshold
+    tail_regressed = tail_ratio is not None and (tail_ci[0] if tail_ci else tail_ratio) > TAIL_REGRESSION_THRESHOLD
+    tail_p50_exceeded = tail_p50_ratio is not None and tail_p50_ratio > TAIL_MEDIAN_RATIO_MAX
+
+    if p50_ratio is not None:
+        result["p50_ratio"] = p50_ratio
+    if tail_ratio is not None:
+        result["tail_ratio"] = tail_ratio
+    if p50_ci is not None:
+        result["p50_ratio_ci"] = p50_ci
+    if tail_ci is not None:
+        result["tail_ratio_ci"] = tail_ci
+    if tail_p50_ratio is not None:
+        result["tail_p50_ratio"] = tail_p50_ratio
+
+    # Fast path: nothing failed, so skip building per-check records.
+    # _iter_rows rebuilds the [OK] lines via _passing_checks.
+    if not (over_hard_limit or p50_regressed or tail_regressed or tail_p50_exceeded):
+        result["status"] = "PASS"
+        result["reason"] = "All checks passed"
+        return result
+
+    result["checks"] = []
+
+    # Check 1: P50 (median) regression
+    if p50_ratio is not None:
+        if over_hard_limit:
+            result["checks"].append({
+                "name": "P50 Hard Limit",
+                "passed": False,
+                "reason": f"Exceeds hard limit ({current_median:.2f} > {hard_limit:.2f} {unit})"
+            })
+        elif p50_regressed:
+            result["checks"].append({
+                "name": "P50 Regression",
+                "passed": False,
+                "reason": f"P50 {p50_ratio:.1%} of baseline{_ci_text(p50_ci)} (threshold: {threshold:.0%})"
+            })
+        else:
+            result["checks"].append({
+                "name": "P50 Regression",
+                "passed": True,
+                "reason": f"P50 {p50_ratio:.1%} of baseline{_ci_text(p50_ci)}"
+            })
+
+    # Check 2: Tail regression
+    if tail_ratio is not None:
+        if tail_regressed:
+            result["checks"].append({
+                "name": "Tail Regression",
+                "passed": False,
+                "reason": f"Tail {tail_ratio:.1%} of baseline{_ci_text(tail_ci)} (threshold: {TAIL_REGRESSION_THRESHOLD:.0%})"
+            })
+        else:
+            result["checks"].append({
+                "name": "Tail Regression",
+                "passed": True,
+                "reason": f"Tail {tail_ratio:.1%} of baseline{_ci_text(tail_ci)}"
+            })
+
+    # Check 3: Tail/P50 ratio sanity check
+    if tail_p50_ratio is not None:
+        if tail_p50_exceeded:
+            result["checks"].append({
+                "name": "Tail/P50 Ratio",
+                "passed": False,
+                "reason": f"Tail/P50 ratio {tail_p50_ratio:.2f}x exceeds {TAIL_MEDIAN_RATIO_MAX}x limit"
+            })
+        else:
+            result["checks"].append({
+                "name": "Tail/P50 Ratio",
+                "passed": True,
+                "reason": f"Tail/P50 ratio {tail_p50_ratio:.2f}x (OK)"
+            })
+
+    # Determine overall status (at least one check failed to get here)
+    regressed = False
+    reasons: list[str] = []
+    for check in result["checks"]:
+        if not check["passed"]:
+            regressed = regressed or "Regression" in check["name"]
+            reasons.append(check["reason"])
+    result["status"] = "REGRESSION" if regressed else "FAIL"
+    result["reason"] = "; ".join(reasons)
+
+    return result
+
+
 def check_regression(
     baseline: dict[str, Any],
     results_dir: Path,
     threshold: float = P50_REGRESSION_THRESHOLD,
     strict_tail: bool = True,
+    verbose: bool = True,
+    tail_method: str = "stddev",
+    bootstrap: bool = False,
+    fail_fast: bool = False,
 ) -> tuple[bool, dict[str, Any]]:
     """
     Check for regressions against baselines.
 
     Args:
-        baseline: Baseline configuration dict
+        baseline: Baseline configuration dict (see validate_baselines)
         results_dir: Path to criterion results
         threshold: P50 regression threshold multiplier
         strict_tail: If True, FAIL validation when tail cannot be extracted
+        verbose: If True, print per-benchmark tail estimation details
+        tail_method: "stddev" (mean + N*std_dev) or "pot" (POT/GPD from sample.json)
+        bootstrap: If True, compare bootstrap CI lower bounds from sample.json
+            instead of point estimates
+        fail_fast: If True, stop at the first REGRESSION or FAIL; later
+            benchmarks are left out of the results
 
     Returns:
         (passed, results_dict)
     """
     results: dict[str, Any] = {}
-    all_passed = True
-
-    benchmarks = baseline.get("benchmarks", {})
-
-    for name, config in benchmarks.items():
-        # Look for benchmark in criterion output
-        benchmark_path = results_dir / BENCHMARK_GROUP / name
-
-        if not benchmark_path.exists():
-            results[name] = {
-                "status": "SKIP",
-                "reason": "No results found",
-            }
-            continue
-
-        estimates = find_criterion_estimate(benchmark_path)
-        if estimates is None:
-            results[name] = {
-                "status": "SKIP",
-                "reason": "Could not parse estimates.json",
-            }
-            continue
-
-        # Extract metrics in nanoseconds
-        current_median_ns = extract_median_ns(estimates)
-        current_tail_ns, tail_estimated = extract_tail_ns(estimates, name)
 
-        if current_median_ns is None:
-            results[name] = {
-                "status": "SKIP",
-                "reason": "Could not extract median from estimates",
-            }
+    # Tail estimation messages are buffered and written once at the end
+    tail_log: list[str] = []
+    log = tail_log.append if verbose else None
+
+    benchmarks = _compile_baselines(baseline)
+    discovered = _discover_estimates(results_dir, [bl.name for bl in benchmarks])
+
+    # Reuse metrics for estimates.json files unchanged since the last run;
+    # only the rest are parsed
+    cache_settings = {
+        "tail_method": tail_method,
+        "tail_stddev_multiplier": TAIL_STDDEV_MULTIPLIER,
+        "pot_percentile": POT_PERCENTILE,
+        "pot_threshold_quantile": POT_THRESHOLD_QUANTILE,
+        "pot_min_samples": POT_MIN_SAMPLES,
+        "bootstrap": bootstrap,
+        "bootstrap_resamples": BOOTSTRAP_RESAMPLES,
+        "bootstrap_alpha": BOOTSTRAP_ALPHA,
+        "bootstrap_seed": BOOTSTRAP_SEED,
+    }
+    previous_cache = _load_metrics_cache(results_dir, cache_settings)
+    cache: dict[str, list[Any]] = {}
+    mtimes: dict[str, int] = {}
+    to_parse: dict[str, str] = {}
+    for bl in benchmarks:
+        name = bl.name
+        estimates_path = discovered.get(name)
+        if estimates_path is None:
             continue
-
-        # FAIL if tail extraction fails and baseline expects tail
-        baseline_tail = get_baseline_tail(config)
-        if current_tail_ns is None and baseline_tail > 0 and strict_tail:
-            results[name] = {
-                "status": "FAIL",
-                "reason": "Could not extract tail from estimates (baseline requires tail)",
-            }
-            all_passed = False
-            continue
-
-        # Get baseline values and unit
-        try:
-            unit = config.get("unit", "ns")
-            if unit not in SUPPORTED_UNITS:
-                raise ValueError(f"Unsupported unit in baseline: {unit}")
-        except ValueError as e:
-            results[name] = {
-                "status": "FAIL",
-                "reason": str(e),
-            }
-            all_passed = False
-            continue
-
-        baseline_p50 = config.get("p50", 0)
-        hard_limit = config.get("hard_limit", float("inf"))
-
-        # Convert to target unit
-        current_median = convert_ns_to_unit(current_median_ns, unit)
-        current_tail = convert_ns_to_unit(current_tail_ns, unit) if current_tail_ns else None
-
-        # Initialize result
-        result: dict[str, Any] = {
-            "current_p50": current_median,
-            "current_tail": current_tail,
-            "baseline_p50": baseline_p50,
-            "baseline_tail": baseline_tail,
-            "unit": unit,
-            "tail_estimated": tail_estimated,
-            "checks": [],
-        }
-
-        # Check 1: P50 (median) regression
-        if baseline_p50 > 0:
-            p50_ratio = current_median / baseline_p50
-            result["p50_ratio"] = p50_ratio
-
-            if current_median > hard_limit:
-                result["checks"].append({
-                    "name": "P50 Hard Limit",
-                    "passed": False,
-                    "reason": f"Exceeds hard limit ({current_median:.2f} > {hard_limit:.2f} {unit})"
-                })
-                all_passed = False
-            elif p50_ratio > threshold:
-                result["checks"].append({
-                    "name": "P50 Regression",
-                    "passed": False,
-                    "reason": f"P50 {p50_ratio:.1%} of baseline (threshold: {threshold:.0%})"
-                })
-                all_passed = False
-            else:
-                result["checks"].append({
-                    "name": "P50 Regression",
-                    "passed": True,
-                    "reason": f"P50 {p50_ratio:.1%} of baseline"
-                })
-
-        # Check 2: Tail regression
-        if current_tail is not None and baseline_tail > 0:
-            tail_ratio = current_tail / baseline_tail
-            result["tail_ratio"] = tail_ratio
-
-            if tail_ratio > TAIL_REGRESSION_THRESHOLD:
-                result["checks"].append({
-                    "name": "Tail Regression",
-                    "passed": False,
-                    "reason": f"Tail {tail_ratio:.1%} of baseline (threshold: {TAIL_REGRESSION_THRESHOLD:.0%})"
-                })
-                all_passed = False
-            else:
-                result["checks"].append({
-                    "name": "Tail Regression",
-                    "passed": True,
-                    "reason": f"Tail {tail_ratio:.1%} of baseline"
-                })
-
-        # Check 3: Tail/P50 ratio sanity check
-        if current_tail is not None and current_median > 0:
-            tail_p50_ratio = current_tail / current_median
-            result["tail_p50_ratio"] = tail_p50_ratio
-
-            if tail_p50_ratio > TAIL_MEDIAN_RATIO_MAX:
-                result["checks"].append({
-                    "name": "Tail/P50 Ratio",
-                    "passed": False,
-                    "reason": f"Tail/P50 ratio {tail_p50_ratio:.2f}x exceeds {TAIL_MEDIAN_RATIO_MAX}x limit"
-                })
-                all_passed = False
-            else:
-                result["checks"].append({
-                    "name": "Tail/P50 Ratio",
-                    "passed": True,
-                    "reason": f"Tail/P50 ratio {tail_p50_ratio:.2f}x (OK)"
-                })
-
-        # Determine overall status
-        failed_checks = [c for c in result["checks"] if not c["passed"]]
-        if failed_checks:
-            result["status"] = "REGRESSION" if any("Regression" in c["name"] for c in failed_checks) else "FAIL"
-            result["reason"] = "; ".join(c["reason"] for c in failed_checks)
+        mtime_ns = os.stat(estimates_path).st_mtime_ns
+        entry = previous_cache.get(name)
+        if entry is not None and entry[0] == estimates_path and entry[1] == mtime_ns:
+            cache[name] = entry
         else:
-            result["status"] = "PASS"
-            result["reason"] = "All checks passed"
-
-        results[name] = result
-
+            mtimes[name] = mtime_ns
+            to_parse[name] = estimates_path
+
+    # Parses run in the background while earlier benchmarks are checked
+    max_workers = min(32, (os.cpu_count() or 1) * 4, len(to_parse)) or 1
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = _submit_estimates(executor, to_parse, mtimes)
+
+        for bl in benchmarks:
+            name = bl.name
+
+            # Look for benchmark in criterion output
+            if name not in discovered:
+                results[name] = {
+                    "status": "SKIP",
+                    "reason": "No results found",
+                }
+                continue
+
+            if name in cache:
+                _, _, current_median_ns, current_tail_ns, tail_estimated, ci_ns = cache[name]
+                if log is not None and current_tail_ns is not None:
+                    log(f"  [{name}] Tail cached: {current_tail_ns:.0f} ns (estimates.json unchanged)")
+            else:
+                # Directories without new/ or base/ estimates were never submitted
+                future = pending.get(name)
+                estimates = future.result() if future is not None else None
+                if estimates is None:
+                    results[name] = {
+                        "status": "SKIP",
+                        "reason": "Could not parse estimates.json",
+                    }
+                    continue
+
+                # Extract metrics in nanoseconds
+                current_median_ns = extract_median_ns(estimates)
+                current_tail_ns = None
+                ci_ns = None
+                # sample.json is read at most once, shared by POT and bootstrap
+                run_dir = os.path.dirname(discovered[name])
+                samples = load_criterion_samples(run_dir) if tail_method == "pot" or bootstrap else None
+                if tail_method == "pot" and samples is not None:
+                    current_tail_ns = extract_tail_pot(run_dir, name, log=log, samples=samples)
+                    tail_estimated = current_tail_ns is not None
+                if current_tail_ns is None:
+                    current_tail_ns, tail_estimated = extract_tail_ns(estimates, name, log)
+                if bootstrap and samples is not None and len(samples) >= 2:
+                    ci_ns = {"p50": list(bootstrap_ci(samples))}
+                    # Only the mean + N*std_dev tail has a per-resample statistic
+                    if tail_method == "stddev":
+                        ci_ns["tail"] = list(bootstrap_ci(samples, _mean_plus_k_stddev))
+                cache[name] = [
+                    discovered[name], mtimes[name], current_median_ns, current_tail_ns, tail_estimated, ci_ns,
+                ]
+
+            results[name] = _check_one(
+                bl, current_median_ns, current_tail_ns, tail_estimated, threshold, strict_tail, ci_ns,
+            )
+            if fail_fast and results[name]["status"] not in ("PASS", "SKIP"):
+                # Drop parses that have not started; running ones finish on exit
+                for future in pending.values():
+                    future.cancel()
+                break
+
+    if discovered:
+        _save_metrics_cache(results_dir, cache, cache_settings)
+
+    _flush_tail_log(tail_log)
+    all_passed = all(result["status"] in ("PASS", "SKIP") for result in results.values())
     return all_passed, results
 
 
@@ -378,89 +945,143 @@ def check_regression(
 # OUTPUT FORMATTERS
 # =============================================================================
 
-def print_results(results: dict[str, Any]) -> None:
-    """Print results in a formatted table."""
-    print("\n" + "=" * 80)
-    print("BENCHMARK VALIDATION RESULTS (W18.3 v1.3: Calibrated Baselines)")
-    print("=" * 80)
-    print(f"Tail estimate: mean + {TAIL_STDDEV_MULTIPLIER}*std_dev (conservative bound)")
-    print(f"Tail/P50 ratio max: {TAIL_MEDIAN_RATIO_MAX}x")
-    print("=" * 80)
+# Status markers for the stdout table and the PR comment table
+_PLAIN_STATUS_INDICATORS: dict[str, str] = {"PASS": "[PASS]", "REGRESSION": "[REGR]", "FAIL": "[FAIL]"}
+_PR_STATUS_ICONS: dict[str, str] = {"PASS": "OK", "REGRESSION": "REGR", "FAIL": "FAIL"}
+
+# PR comment table row, bound once and filled from a dict of cell strings
+_PR_ROW = "| {name} | {p50} | {tail} | {p50_ratio} | {tail_ratio} | {status} |".format_map
+
+
+def _iter_rows(results: dict[str, Any]) -> Iterator[tuple[str, str]]:
+    """
+    Format each benchmark result for both output formats in one pass.
 
+    Yields (plain, markdown) per benchmark: the print_results block and
+    the generate_pr_comment table row. Shared fields are formatted once.
+    """
     for name, data in results.items():
         status = data.get("status", "UNKNOWN")
 
         if status == "SKIP":
-            print(f"\n{name}: SKIP - {data.get('reason', '')}")
+            yield (
+                f"\n{name}: SKIP - {data.get('reason', '')}",
+                _PR_ROW({"name": name, "p50": "-", "tail": "-", "p50_ratio": "-", "tail_ratio": "-", "status": "SKIP"}),
+            )
             continue
 
         current_p50 = data.get("current_p50", 0)
         current_tail = data.get("current_tail")
         baseline_p50 = data.get("baseline_p50", 0)
         baseline_tail = data.get("baseline_tail", 0)
+        p50_ratio = data.get("p50_ratio", 0)
+        tail_ratio = data.get("tail_ratio")
         unit = data.get("unit", "ns")
         tail_estimated = data.get("tail_estimated", False)
 
-        # Status indicator
-        indicator = {"PASS": "[PASS]", "REGRESSION": "[REGR]", "FAIL": "[FAIL]"}.get(status, "[????]")
-
-        print(f"\n{indicator} {name}")
-        print(f"    P50:  {current_p50:.2f} {unit} (baseline: {baseline_p50:.2f} {unit})")
+        p50_str = f"{current_p50:.2f} {unit}"
+        tail_str = f"{current_tail:.2f} {unit}" if current_tail is not None else "-"
+
+        # Plain-text block
+        indicator = _PLAIN_STATUS_INDICATORS.get(status, "[????]")
+        plain = [
+            f"\n{indicator} {name}",
+            f"    P50:  {p50_str} (baseline: {baseline_p50:.2f} {unit})",
+        ]
         if current_tail is not None:
             est_marker = " (estimated)" if tail_estimated else ""
-            print(f"    Tail: {current_tail:.2f} {unit} (baseline: {baseline_tail:.2f} {unit}){est_marker}")
+            plain.append(f"    Tail: {tail_str} (baseline: {baseline_tail:.2f} {unit}){est_marker}")
             if current_p50 > 0:
-                print(f"    Tail/P50 Ratio: {current_tail/current_p50:.2f}x")
+                plain.append(f"    Tail/P50 Ratio: {current_tail/current_p50:.2f}x")
 
-        # Print check details
-        for check in data.get("checks", []):
+        # Check details
+        checks = data.get("checks")
+        if checks is None:
+            checks = _passing_checks(data) if status == "PASS" else []
+        for check in checks:
             check_indicator = "  [OK]" if check["passed"] else "  [!!]"
-            print(f"    {check_indicator} {check['name']}: {check['reason']}")
-
-    print("\n" + "=" * 80)
-
-
-def generate_pr_comment(results: dict[str, Any], passed: bool) -> str:
-    """Generate a markdown comment for PR with tail metrics."""
-    lines = ["## Benchmark Validation Results (W18.3 v1.3)\n"]
-
-    if passed:
-        lines.append("All benchmarks within threshold.\n")
-    else:
-        lines.append("**Regression detected!** See details below.\n")
-
-    # Summary table with tail
-    lines.append("| Benchmark | P50 | Tail | P50 vs Baseline | Tail vs Baseline | Status |")
-    lines.append("|:----------|----:|-----:|----------------:|-----------------:|:-------|")
-
-    for name, data in results.items():
-        status = data.get("status", "SKIP")
-        if status == "SKIP":
-            lines.append(f"| {name} | - | - | - | - | SKIP |")
-            continue
-
-        current_p50 = data.get("current_p50", 0)
-        current_tail = data.get("current_tail")
-        p50_ratio = data.get("p50_ratio", 0)
-        tail_ratio = data.get("tail_ratio")
-        unit = data.get("unit", "ns")
-
-        p50_str = f"{current_p50:.2f} {unit}"
-        tail_str = f"{current_tail:.2f} {unit}" if current_tail else "-"
-        p50_ratio_str = f"{p50_ratio:.0%}" if p50_ratio else "-"
-        tail_ratio_str = f"{tail_ratio:.0%}" if tail_ratio else "-"
-
-        status_icon = {"PASS": "OK", "REGRESSION": "REGR", "FAIL": "FAIL"}.get(status, "??")
+            plain.append(f"    {check_indicator} {check['name']}: {check['reason']}")
+
+        # Markdown row
+        markdown = _PR_ROW({
+            "name": name,
+            "p50": p50_str,
+            "tail": tail_str if current_tail else "-",
+            "p50_ratio": f"{p50_ratio:.0%}" if p50_ratio else "-",
+            "tail_ratio": f"{tail_ratio:.0%}" if tail_ratio else "-",
+            "status": _PR_STATUS_ICONS.get(status, "??"),
+        })
+
+        yield "\n".join(plain), markdown
+
+
+def print_results(
+    results: dict[str, Any],
+    rows: list[tuple[str, str]] | None = None,
+    tail_method: str = "stddev",
+) -> None:
+    """
+    Print results in a formatted table.
 
-        lines.append(f"| {name} | {p50_str} | {tail_str} | {p50_ratio_str} | {tail_ratio_str} | {status_icon} |")
+    Pass rows from _iter_rows to share formatting with generate_pr_comment.
+    """
+    if rows is None:
+        rows = list(_iter_rows(results))
+
+    lines = [
+        "\n" + "=" * 80,
+        "BENCHMARK VALIDATION RESULTS (W18.3 v1.3: Calibrated Baselines)",
+        "=" * 80,
+        f"Tail estimate: {_tail_method_description(tail_method)}",
+        f"Tail/P50 ratio max: {TAIL_MEDIAN_RATIO_MAX}x",
+        "=" * 80,
+    ]
+    lines.extend(plain for plain, _ in rows)
+    lines.append("\n" + "=" * 80)
+
+    # Single write instead of one print() per line
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def generate_pr_comment(
+    results: dict[str, Any],
+    passed: bool,
+    rows: list[tuple[str, str]] | None = None,
+    tail_method: str = "stddev",
+) -> str:
+    """
+    Generate a markdown comment for PR with tail metrics.
 
-    lines.append("\n### Thresholds")
-    lines.append(f"- P50 regression: >{P50_REGRESSION_THRESHOLD:.0%} of baseline")
-    lines.append(f"- Tail regression: >{TAIL_REGRESSION_THRESHOLD:.0%} of baseline")
-    lines.append(f"- Tail/P50 ratio: <{TAIL_MEDIAN_RATIO_MAX}x")
-    lines.append(f"\n*Tail estimated as mean + {TAIL_STDDEV_MULTIPLIER}*std_dev (conservative bound)*")
+    Pass rows from _iter_rows to share formatting with print_results.
+    """
+    if rows is None:
+        rows = list(_iter_rows(results))
+
+    status_line = "All benchmarks within threshold." if passed else "**Regression detected!** See details below."
+
+    buf = io.StringIO()
+    write = buf.write
+    write(
+        "## Benchmark Validation Results (W18.3 v1.3)\n"
+        "\n"
+        f"{status_line}\n"
+        "\n"
+        # Summary table with tail
+        "| Benchmark | P50 | Tail | P50 vs Baseline | Tail vs Baseline | Status |\n"
+        "|:----------|----:|-----:|----------------:|-----------------:|:-------|\n"
+    )
+    for _, markdown in rows:
+        write(markdown)
+        write("\n")
+    write(
+        "\n### Thresholds\n"
+        f"- P50 regression: >{P50_REGRESSION_THRESHOLD:.0%} of baseline\n"
+        f"- Tail regression: >{TAIL_REGRESSION_THRESHOLD:.0%} of baseline\n"
+        f"- Tail/P50 ratio: <{TAIL_MEDIAN_RATIO_MAX}x\n"
+        f"\n*Tail estimated as {_tail_method_description(tail_method)}*"
+    )
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 # =============================================================================
@@ -490,13 +1111,29 @@ def main() -> None:
     parser.add_argument(
         "--pr-comment",
         action="store_true",
-        help="Generate PR comment markdown",
+        help="Generate PR comment markdown (combine with --quiet for markdown only)",
     )
     parser.add_argument(
         "--quiet",
         action="store_true",
         help="Only print final status",
     )
+    parser.add_argument(
+        "--tail-method",
+        choices=TAIL_METHODS,
+        default="stddev",
+        help="Tail estimator: mean + N*std_dev (default) or POT/GPD fit over sample.json",
+    )
+    parser.add_argument(
+        "--bootstrap",
+        action="store_true",
+        help=f"Fail only when the {1 - BOOTSTRAP_ALPHA:.0%}% bootstrap CI lower bound (from sample.json) exceeds the threshold",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop checking at the first regression or failure",
+    )
     parser.add_argument(
         "--lenient-tail",
         action="store_true",
@@ -515,13 +1152,18 @@ def main() -> None:
 
     # Check for regressions
     strict_tail = not args.lenient_tail
-    passed, results = check_regression(baseline, args.results, threshold, strict_tail)
+    passed, results = check_regression(
+        baseline, args.results, threshold, strict_tail,
+        verbose=not args.quiet, tail_method=args.tail_method, bootstrap=args.bootstrap,
+        fail_fast=args.fail_fast,
+    )
 
-    # Output results
+    # Output results (rows are formatted once and shared by both outputs)
+    rows = list(_iter_rows(results))
+    if not args.quiet:
+        print_results(results, rows, args.tail_method)
     if args.pr_comment:
-        print(generate_pr_comment(results, passed))
-    elif not args.quiet:
-        print_results(results)
+        sys.stdout.write(generate_pr_comment(results, passed, rows, args.tail_method) + "\n")
 
     # Final status
     if passed:
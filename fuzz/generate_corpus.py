@@ -14,33 +14,93 @@ Input Formats:
 
 import struct
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 BASE_DIR = Path(__file__).parent / "corpus"
 
+# Per-thread state so generators can run concurrently: seeds queued by
+# write_seed() until run_generator() flushes them, and the buffered log
+_local = threading.local()
+
+
+def log(message: str):
+    """Print a progress message, or buffer it when run through run_generator()."""
+    buffered = getattr(_local, "log", None)
+    if buffered is None:
+        print(message)
+    else:
+        buffered.append(message)
+
+
+def _pending_seeds() -> list[tuple[Path, bytes]]:
+    """Seeds queued on this thread and not yet flushed."""
+    try:
+        return _local.seeds
+    except AttributeError:
+        _local.seeds = []
+        return _local.seeds
+
 
 def write_seed(target: str, name: str, data: bytes):
-    """Write a seed file to the target's corpus directory."""
-    target_dir = BASE_DIR / target
-    target_dir.mkdir(parents=True, exist_ok=True)
-    seed_path = target_dir / name
-    seed_path.write_bytes(data)
-    print(f"  Created: {seed_path.name} ({len(data)} bytes)")
+    """Queue a seed file for the target's corpus directory (see flush_seeds)."""
+    _pending_seeds().append((BASE_DIR / target / name, data))
+
+
+def flush_seeds():
+    """
+    Write all queued seeds, creating each target directory only once.
+
+    run_generator() calls this after each generator; seeds are logged as
+    created once they are on disk.
+    """
+    pending = _pending_seeds()
+    for target_dir in {seed_path.parent for seed_path, _ in pending}:
+        target_dir.mkdir(parents=True, exist_ok=True)
+
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    for seed_path, data in pending:
+        fd = os.open(seed_path, flags, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        log(f"  Created: {seed_path.name} ({len(data)} bytes)")
 
+    pending.clear()
 
-def f32_bytes(value: float) -> bytes:
-    """Convert float to little-endian bytes."""
-    return struct.pack("<f", value)
 
+# Precompiled packers; the bound pack methods skip format-string parsing per call
+_F32 = struct.Struct("<f")
+_U32 = struct.Struct("<I")
+_U8 = struct.Struct("<B")
 
-def u32_bytes(value: int) -> bytes:
-    """Convert u32 to little-endian bytes."""
-    return struct.pack("<I", value)
+f32_bytes = _F32.pack  # float -> 4 little-endian bytes
+u32_bytes = _U32.pack  # u32 -> 4 little-endian bytes
+u8_bytes = _U8.pack  # u8 -> 1 byte
 
+# Recurring 4D vectors, built once at import
+ZERO4 = f32_bytes(0.0) * 4
+UNIT4 = f32_bytes(1.0) * 4
+HALF4 = f32_bytes(0.5) * 4
 
-def u8_bytes(value: int) -> bytes:
-    """Convert u8 to bytes."""
-    return struct.pack("<B", value)
+# hnsw_insert command bytes
+OP_INSERT = 0  # cmd < 220
+OP_SEARCH = 250  # cmd >= 220
+CMD_INSERT = u8_bytes(OP_INSERT)
+CMD_SEARCH = u8_bytes(OP_SEARCH)
+
+# One hnsw_insert record: [cmd: u8][vector: 4 x f32], no padding
+_INSERT_RECORD = struct.Struct("<B4f")
+
+
+def splat_records(records) -> bytes:
+    """Pack (cmd, value) pairs as hnsw_insert records with value in all 4 lanes."""
+    pack = _INSERT_RECORD.pack
+    return b"".join([pack(cmd, value, value, value, value) for cmd, value in records])
 
 
 # =============================================================================
@@ -50,68 +110,53 @@ def u8_bytes(value: int) -> bytes:
 # =============================================================================
 
 def generate_hnsw_insert_seeds():
-    print("\nGenerating hnsw_insert seeds...")
+    log("\nGenerating hnsw_insert seeds...")
 
     # Seed 1: Single insert - zero vector
-    cmd_insert = u8_bytes(0)  # INSERT
-    zero_vec = f32_bytes(0.0) * 4
-    write_seed("hnsw_insert", "01_single_insert_zero", cmd_insert + zero_vec)
+    write_seed("hnsw_insert", "01_single_insert_zero", CMD_INSERT + ZERO4)
 
     # Seed 2: Single insert - unit vector
-    unit_vec = f32_bytes(1.0) * 4
-    write_seed("hnsw_insert", "02_single_insert_unit", cmd_insert + unit_vec)
+    write_seed("hnsw_insert", "02_single_insert_unit", CMD_INSERT + UNIT4)
 
     # Seed 3: Multiple inserts
-    data = b""
-    for i in range(5):
-        data += cmd_insert
-        data += f32_bytes(float(i)) * 4
+    data = splat_records((OP_INSERT, float(i)) for i in range(5))
     write_seed("hnsw_insert", "03_multiple_inserts", data)
 
     # Seed 4: Insert then search
-    data = cmd_insert + unit_vec  # Insert
-    cmd_search = u8_bytes(250)  # SEARCH (>= 220)
-    data += cmd_search + zero_vec  # Search
+    data = CMD_INSERT + UNIT4  # Insert
+    data += CMD_SEARCH + ZERO4  # Search
     write_seed("hnsw_insert", "04_insert_then_search", data)
 
     # Seed 5: Many inserts (stress test)
-    data = b""
-    for i in range(20):
-        data += cmd_insert
-        data += f32_bytes(float(i * 0.1)) * 4
+    data = splat_records((OP_INSERT, float(i * 0.1)) for i in range(20))
     write_seed("hnsw_insert", "05_many_inserts", data)
 
     # Seed 6: Alternating insert/search
-    data = b""
-    for i in range(5):
-        data += cmd_insert + f32_bytes(float(i)) * 4
-        data += cmd_search + f32_bytes(float(i)) * 4
+    data = splat_records(
+        (op, float(i)) for i in range(5) for op in (OP_INSERT, OP_SEARCH)
+    )
     write_seed("hnsw_insert", "06_alternating_ops", data)
 
     # Seed 7: Edge case - large values
     large_vec = f32_bytes(1e30) + f32_bytes(-1e30) + f32_bytes(1e-30) + f32_bytes(-1e-30)
-    write_seed("hnsw_insert", "07_large_values", cmd_insert + large_vec)
+    write_seed("hnsw_insert", "07_large_values", CMD_INSERT + large_vec)
 
     # Seed 8: Edge case - all same value
-    same_vec = f32_bytes(0.5) * 4
-    write_seed("hnsw_insert", "08_same_values", cmd_insert + same_vec)
+    write_seed("hnsw_insert", "08_same_values", CMD_INSERT + HALF4)
 
     # Seed 9: Negative values
     neg_vec = f32_bytes(-1.0) + f32_bytes(-2.0) + f32_bytes(-3.0) + f32_bytes(-4.0)
-    write_seed("hnsw_insert", "09_negative_values", cmd_insert + neg_vec)
+    write_seed("hnsw_insert", "09_negative_values", CMD_INSERT + neg_vec)
 
     # Seed 10: Mixed positive/negative
     mixed_vec = f32_bytes(1.0) + f32_bytes(-1.0) + f32_bytes(2.0) + f32_bytes(-2.0)
-    write_seed("hnsw_insert", "10_mixed_signs", cmd_insert + mixed_vec)
+    write_seed("hnsw_insert", "10_mixed_signs", CMD_INSERT + mixed_vec)
 
     # Seed 11: Search on empty graph (before any inserts)
-    write_seed("hnsw_insert", "11_search_empty", cmd_search + zero_vec)
+    write_seed("hnsw_insert", "11_search_empty", CMD_SEARCH + ZERO4)
 
     # Seed 12: Dense cluster - many similar vectors
-    data = b""
-    for i in range(10):
-        data += cmd_insert
-        data += f32_bytes(1.0 + i * 0.01) * 4
+    data = splat_records((OP_INSERT, 1.0 + i * 0.01) for i in range(10))
     write_seed("hnsw_insert", "12_dense_cluster", data)
 
 
@@ -122,7 +167,7 @@ def generate_hnsw_insert_seeds():
 # =============================================================================
 
 def generate_hnsw_search_seeds():
-    print("\nGenerating hnsw_search seeds...")
+    log("\nGenerating hnsw_search seeds...")
 
     # These are raw bytes that arbitrary::Unstructured will parse
     # The exact interpretation depends on the fuzzer's parsing logic
@@ -178,7 +223,7 @@ def generate_hnsw_search_seeds():
 # =============================================================================
 
 def generate_graph_ops_seeds():
-    print("\nGenerating graph_ops seeds...")
+    log("\nGenerating graph_ops seeds...")
 
     # arbitrary parses these bytes into Vec<Op>
     # The exact mapping depends on the derive implementation
@@ -226,7 +271,7 @@ def generate_graph_ops_seeds():
     write_seed("graph_ops", "11_delete_ids", data * 3)
 
     # Seed 12: Search with k values
-    data = bytes([2]) + f32_bytes(0.0) * 4 + bytes([10])  # k=10
+    data = bytes([2]) + ZERO4 + bytes([10])  # k=10
     write_seed("graph_ops", "12_search_k", data * 5)
 
 
@@ -237,45 +282,41 @@ def generate_graph_ops_seeds():
 # =============================================================================
 
 def generate_search_robustness_seeds():
-    print("\nGenerating search_robustness seeds...")
+    log("\nGenerating search_robustness seeds...")
 
     # Seed 1: Valid entry point (NodeId 0), simple query
     entry = u32_bytes(0)
-    query = f32_bytes(0.5) * 4  # 4D query
-    write_seed("search_robustness", "01_valid_entry", entry + query)
+    write_seed("search_robustness", "01_valid_entry", entry + HALF4)
 
     # Seed 2: Entry point 1
     entry = u32_bytes(1)
-    write_seed("search_robustness", "02_entry_1", entry + query)
+    write_seed("search_robustness", "02_entry_1", entry + HALF4)
 
     # Seed 3: Entry point 2
     entry = u32_bytes(2)
-    write_seed("search_robustness", "03_entry_2", entry + query)
+    write_seed("search_robustness", "03_entry_2", entry + HALF4)
 
     # Seed 4: Entry point 3
     entry = u32_bytes(3)
-    write_seed("search_robustness", "04_entry_3", entry + query)
+    write_seed("search_robustness", "04_entry_3", entry + HALF4)
 
     # Seed 5: Invalid entry point (very large)
     entry = u32_bytes(0xFFFFFFFF)
-    write_seed("search_robustness", "05_invalid_large", entry + query)
+    write_seed("search_robustness", "05_invalid_large", entry + HALF4)
 
     # Seed 6: Invalid entry point (100)
     entry = u32_bytes(100)
-    write_seed("search_robustness", "06_invalid_100", entry + query)
+    write_seed("search_robustness", "06_invalid_100", entry + HALF4)
 
     # Seed 7: Zero query vector
     entry = u32_bytes(0)
-    zero_query = f32_bytes(0.0) * 4
-    write_seed("search_robustness", "07_zero_query", entry + zero_query)
+    write_seed("search_robustness", "07_zero_query", entry + ZERO4)
 
     # Seed 8: Unit query vector
-    unit_query = f32_bytes(1.0) * 4
-    write_seed("search_robustness", "08_unit_query", entry + unit_query)
+    write_seed("search_robustness", "08_unit_query", entry + UNIT4)
 
     # Seed 9: Large dimension query (8D)
-    large_query = f32_bytes(0.5) * 8
-    write_seed("search_robustness", "09_8d_query", entry + large_query)
+    write_seed("search_robustness", "09_8d_query", entry + HALF4 * 2)
 
     # Seed 10: Single float query (1D)
     single_query = f32_bytes(0.5)
@@ -286,23 +327,48 @@ def generate_search_robustness_seeds():
     write_seed("search_robustness", "11_mixed_query", entry + mixed_query)
 
     # Seed 12: Exact match to vector 0 ([0,0,0,0])
-    exact_query = f32_bytes(0.0) * 4
-    write_seed("search_robustness", "12_exact_match", entry + exact_query)
+    write_seed("search_robustness", "12_exact_match", entry + ZERO4)
 
     # Seed 13: Boundary entry point values
     for i, ep in enumerate([0, 1, 2, 3, 4, 5, 10, 255]):
         entry = u32_bytes(ep)
-        write_seed("search_robustness", f"13_boundary_{i}", entry + query)
+        write_seed("search_robustness", f"13_boundary_{i}", entry + HALF4)
+
+
+# Independent generators writing to disjoint corpus directories
+GENERATORS = (
+    generate_hnsw_insert_seeds,
+    generate_hnsw_search_seeds,
+    generate_graph_ops_seeds,
+    generate_search_robustness_seeds,
+)
+
+
+def run_generator(generate) -> list[str]:
+    """
+    Run one seed generator on the current thread and return its log lines.
+
+    Generators only queue seeds with write_seed(); this writes them, so
+    new generators need no flush of their own.
+    """
+    _local.log = []
+    try:
+        generate()
+        flush_seeds()
+        return _local.log
+    finally:
+        _pending_seeds().clear()
+        del _local.log
 
 
 def main():
     print("EdgeVec Corpus Seed Generator")
     print("=" * 50)
 
-    generate_hnsw_insert_seeds()
-    generate_hnsw_search_seeds()
-    generate_graph_ops_seeds()
-    generate_search_robustness_seeds()
+    # Generators run concurrently; logs are printed in generator order
+    with ThreadPoolExecutor(max_workers=len(GENERATORS)) as executor:
+        for lines in executor.map(run_generator, GENERATORS):
+            print("\n".join(lines))
 
     print("\n" + "=" * 50)
     print("Corpus generation complete!")